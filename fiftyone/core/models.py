@@ -5,11 +5,21 @@ FiftyOne models.
 | `voxel51.com <https://voxel51.com/>`_
 |
 """
+import collections
 import contextlib
+import copy
+import functools
+import importlib.util
 import inspect
+import io
+import json
 import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
+from PIL import Image
 
 import eta.core.frameutils as etaf
 import eta.core.learning as etal
@@ -26,6 +36,7 @@ import fiftyone.core.media as fom
 import fiftyone.core.utils as fou
 import fiftyone.core.validation as fov
 
+av = fou.lazy_import("av")
 tud = fou.lazy_import("torch.utils.data")
 
 foue = fou.lazy_import("fiftyone.utils.eta")
@@ -48,6 +59,8 @@ _ALLOWED_PATCH_TYPES = (
     fol.Polylines,
 )
 
+_DEFAULT_BATCH_SIZE = 16
+
 
 def apply_model(
     samples,
@@ -83,8 +96,9 @@ def apply_model(
         store_logits (False): whether to store logits for the model
             predictions. This is only supported when the provided ``model`` has
             logits, ``model.has_logits == True``
-        batch_size (None): an optional batch size to use, if the model supports
-            batching
+        batch_size (None): an optional batch size to use, if the model
+            supports batching. By default, models that provide batched
+            inference are applied with a batch size of 16
         num_workers (None): the number of workers to use when loading images.
             Only applicable for Torch-based models
         skip_failures (True): whether to gracefully continue without raising an
@@ -193,7 +207,8 @@ def apply_model(
                 fou.SetAttributes(model, needs_fields=kwargs)
             )
 
-        context.enter_context(model)
+        if not getattr(model, "_entered", False):
+            context.enter_context(model)
 
         if needs_samples:
             fields = list(model.needs_fields.values())
@@ -308,6 +323,95 @@ def _convert_model_if_necessary(model):
     return model
 
 
+_TURBO_JPEG = None
+
+
+def _get_turbo_jpeg():
+    # PyTurboJPEG releases the GIL for the entire JPEG decode, so prefetch
+    # worker threads scale with cores when it is available
+    global _TURBO_JPEG
+
+    if _TURBO_JPEG is None:
+        try:
+            import turbojpeg
+
+            _TURBO_JPEG = (turbojpeg.TurboJPEG(), turbojpeg.TJPF_RGB)
+        except Exception:
+            _TURBO_JPEG = False
+
+    return _TURBO_JPEG or None
+
+
+def _get_jpeg_orientation(data):
+    # Returns the EXIF orientation flag for the given encoded image, or 1 if
+    # no orientation is present or it cannot be parsed
+    try:
+        with Image.open(io.BytesIO(data)) as pil_img:
+            return pil_img.getexif().get(0x0112, 1)
+    except Exception:
+        return 1
+
+
+def _get_input_dtype(model):
+    # Returns the non-default input dtype that the model expects, if any
+    dtype = getattr(model, "input_dtype", None)
+    if dtype is None:
+        return None
+
+    dtype = np.dtype(dtype)
+    if dtype == np.uint8:
+        return None
+
+    return dtype
+
+
+def _iter_images(samples, num_workers=4, queue_depth=8, dtype=None):
+    # Iterates over `(sample, img)` pairs in order, prefetching image reads on
+    # a thread pool so that decoding overlaps with inference. Read failures
+    # are yielded as the `Exception` that was raised
+    turbo_jpeg = _get_turbo_jpeg()
+
+    def _read(filepath):
+        try:
+            img = None
+            if turbo_jpeg is not None and filepath.lower().endswith(
+                (".jpg", ".jpeg")
+            ):
+                decoder, pixel_format = turbo_jpeg
+                try:
+                    with open(filepath, "rb") as f:
+                        data = f.read()
+
+                    # TurboJPEG does not apply EXIF orientation, so defer to
+                    # `foui.read` for rotated images
+                    if _get_jpeg_orientation(data) == 1:
+                        img = decoder.decode(data, pixel_format=pixel_format)
+                except Exception:
+                    pass
+
+            if img is None:
+                img = foui.read(filepath)
+
+            if dtype is not None and img.dtype != dtype:
+                img = img.astype(dtype, copy=False)
+
+            return img
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=num_workers) as executor:
+        pending = collections.deque()
+        for sample in samples:
+            pending.append((sample, executor.submit(_read, sample.filepath)))
+            if len(pending) >= queue_depth:
+                _sample, future = pending.popleft()
+                yield _sample, future.result()
+
+        while pending:
+            _sample, future = pending.popleft()
+            yield _sample, future.result()
+
+
 def _apply_image_model_single(
     samples,
     model,
@@ -319,18 +423,23 @@ def _apply_image_model_single(
 ):
     needs_samples = isinstance(model, SamplesMixin)
 
+    # Bind hot attributes once outside the per-sample loop
+    predict = model.predict
+    input_dtype = _get_input_dtype(model)
+
     with contextlib.ExitStack() as context:
-        pb = context.enter_context(fou.ProgressBar(progress=progress))
+        pb = context.enter_context(fou.ProgressBar(samples, progress=progress))
         ctx = context.enter_context(foc.SaveContext(samples))
 
-        for sample in pb(samples):
+        for sample, img in pb(_iter_images(samples, dtype=input_dtype)):
             try:
-                img = foui.read(sample.filepath)
+                if isinstance(img, Exception):
+                    raise img
 
                 if needs_samples:
-                    labels = model.predict(img, sample=sample)
+                    labels = predict(img, sample=sample)
                 else:
-                    labels = model.predict(img)
+                    labels = predict(img)
 
                 if filename_maker is not None:
                     _export_arrays(labels, sample.filepath, filename_maker)
@@ -359,14 +468,24 @@ def _apply_image_model_batch(
     progress,
 ):
     needs_samples = isinstance(model, SamplesMixin)
+    input_dtype = _get_input_dtype(model)
 
     with contextlib.ExitStack() as context:
         pb = context.enter_context(fou.ProgressBar(samples, progress=progress))
         ctx = context.enter_context(foc.SaveContext(samples))
 
-        for sample_batch in fou.iter_batches(samples, batch_size):
+        for batch in fou.iter_batches(
+            _iter_images(samples, dtype=input_dtype), batch_size
+        ):
+            sample_batch = [sample for sample, _ in batch]
+
             try:
-                imgs = [foui.read(sample.filepath) for sample in sample_batch]
+                imgs = []
+                for _, img in batch:
+                    if isinstance(img, Exception):
+                        raise img
+
+                    imgs.append(img)
 
                 if needs_samples:
                     labels_batch = model.predict_all(
@@ -433,6 +552,8 @@ def _apply_image_model_data_loader(
                     labels_batch = model.predict_all(
                         imgs, samples=sample_batch
                     )
+                elif model.accepts_gpu_tensor and not isinstance(imgs, list):
+                    labels_batch = model.predict_tensor(imgs)
                 else:
                     labels_batch = model.predict_all(imgs)
 
@@ -474,6 +595,9 @@ def _apply_image_model_to_frames_single(
     frame_counts, total_frame_count = _get_frame_counts(samples)
     is_clips = samples._dataset._is_clips
 
+    # Bind hot attributes once outside the per-frame loops
+    predict = model.predict
+
     with contextlib.ExitStack() as context:
         pb = context.enter_context(
             fou.ProgressBar(total=total_frame_count, progress=progress)
@@ -487,15 +611,15 @@ def _apply_image_model_to_frames_single(
                 frames = None
 
             try:
-                with etav.FFmpegVideoReader(
+                with _open_video_reader(
                     sample.filepath, frames=frames
                 ) as video_reader:
-                    for img in video_reader:
+                    for frame_number, img in _iter_video_frames(video_reader):
                         if needs_samples:
-                            frame = sample.frames[video_reader.frame_number]
-                            labels = model.predict(img, sample=frame)
+                            frame = sample.frames[frame_number]
+                            labels = predict(img, sample=frame)
                         else:
-                            labels = model.predict(img)
+                            labels = predict(img)
 
                         if filename_maker is not None:
                             _export_arrays(
@@ -503,7 +627,7 @@ def _apply_image_model_to_frames_single(
                             )
 
                         sample.add_labels(
-                            {video_reader.frame_number: labels},
+                            {frame_number: labels},
                             label_field=label_field,
                             confidence_thresh=confidence_thresh,
                         )
@@ -548,10 +672,12 @@ def _apply_image_model_to_frames_batch(
                 frames = None
 
             try:
-                with etav.FFmpegVideoReader(
+                with _open_video_reader(
                     sample.filepath, frames=frames
                 ) as video_reader:
-                    for fns, imgs in _iter_batches(video_reader, batch_size):
+                    for fns, imgs in _iter_batches(
+                        _iter_video_frames(video_reader), batch_size
+                    ):
                         if needs_samples:
                             _frames = [sample.frames[fn] for fn in fns]
                             labels_batch = model.predict_all(
@@ -611,7 +737,7 @@ def _apply_video_model(
                 frames = None
 
             try:
-                with etav.FFmpegVideoReader(
+                with _open_video_reader(
                     sample.filepath, frames=frames
                 ) as video_reader:
                     if needs_samples:
@@ -670,12 +796,187 @@ def _get_frame_counts(samples):
     return frame_counts, total_frame_count
 
 
-def _iter_batches(video_reader, batch_size):
+_PYAV_AVAILABLE = None
+
+
+def _open_video_reader(video_path, frames=None):
+    # PyAV decodes in-process, avoiding the fork/exec and per-frame pipe copy
+    # of an external ffmpeg process, which dominates for short clips
+    global _PYAV_AVAILABLE
+
+    if _PYAV_AVAILABLE is None:
+        _PYAV_AVAILABLE = importlib.util.find_spec("av") is not None
+
+    if _PYAV_AVAILABLE:
+        try:
+            return _PyAVVideoReader(video_path, frames=frames)
+        except Exception as e:
+            logger.debug(
+                "PyAV failed to open '%s' (%s); falling back to ffmpeg",
+                video_path,
+                e,
+            )
+
+    return _FFmpegVideoReader(video_path, frames=frames)
+
+
+class _PyAVVideoReader(etav.VideoReader):
+    """VideoReader that decodes video in-process via PyAV.
+
+    Unlike ``eta.core.video.FFmpegVideoReader``, no external ffmpeg subprocess
+    is spawned and frames are never copied through a pipe.
+    """
+
+    def __init__(self, inpath, frames=None):
+        self._container = None
+        self._stream = None
+        self._frames_iter = None
+        self._open_stream(inpath)
+        super().__init__(inpath, frames)
+
+    def _open_stream(self, inpath):
+        self._container = av.open(inpath)
+        self._stream = self._container.streams.video[0]
+        self._stream.thread_type = "AUTO"
+        self._frames_iter = self._container.decode(self._stream)
+
+    def close(self):
+        if self._container is not None:
+            self._container.close()
+            self._container = None
+
+    def reset(self):
+        self.close()
+        self._reset()
+        self._open_stream(self.inpath)
+
+    @property
+    def encoding_str(self):
+        return self._stream.codec_context.name
+
+    @property
+    def frame_size(self):
+        return (self._stream.width, self._stream.height)
+
+    @property
+    def frame_rate(self):
+        return float(self._stream.average_rate)
+
+    @property
+    def total_frame_count(self):
+        return int(self._stream.frames or 0)
+
+    def read(self):
+        frame = None
+        for _ in range(max(0, self.frame_number), next(self._ranges)):
+            frame = next(self._frames_iter, None)
+            if frame is None:
+                raise StopIteration
+
+        if frame is None:
+            raise StopIteration
+
+        return frame.to_ndarray(format="rgb24")
+
+
+class _FFmpegVideoReader(etav.FFmpegVideoReader):
+    """Drop-in replacement for ``eta.core.video.FFmpegVideoReader`` that reads
+    each raw frame from ffmpeg's stdout directly into a preshaped numpy array.
+
+    The base class reads an intermediate ``bytes`` object per frame and then
+    copies it into an array, which costs an extra H x W x 3 memcpy per frame.
+
+    Each ``read()`` returns a freshly allocated array, so callers are free to
+    buffer frames across reads.
+    """
+
+    def _grab(self):
+        stdout = getattr(getattr(self._ffmpeg, "_p", None), "stdout", None)
+        if stdout is None:
+            return super()._grab()
+
+        try:
+            width, height = self.frame_size
+            frame = np.empty((height, width, 3), dtype=np.uint8)
+            num_bytes = stdout.readinto(memoryview(frame).cast("B"))
+            if num_bytes == frame.nbytes:
+                self._raw_frame = frame
+            else:
+                # EOF or truncated frame
+                self._raw_frame = None
+
+            return True
+        except Exception as e:
+            logger.warning(e, exc_info=True)
+            self._raw_frame = None
+            return False
+
+    def _retrieve(self):
+        if isinstance(self._raw_frame, np.ndarray):
+            return self._raw_frame
+
+        if self._raw_frame is None:
+            logger.warning(
+                "Found empty frame %d. Raising StopIteration now",
+                self.frame_number,
+            )
+            raise StopIteration
+
+        return super()._retrieve()
+
+
+def _iter_video_frames(video_reader, queue_depth=8):
+    # Decodes frames on a background thread so that ffmpeg decode overlaps
+    # with inference in the main thread. Yields `(frame_number, img)` pairs
+    # in frame order
+    frame_queue = queue.Queue(maxsize=queue_depth)
+    stop = threading.Event()
+    done = object()
+
+    def _put(item):
+        while not stop.is_set():
+            try:
+                frame_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _decode():
+        try:
+            for img in video_reader:
+                if not _put((video_reader.frame_number, img)):
+                    return
+        except Exception as e:
+            _put(e)
+        finally:
+            _put(done)
+
+    thread = threading.Thread(target=_decode, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = frame_queue.get()
+            if item is done:
+                break
+
+            if isinstance(item, Exception):
+                raise item
+
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _iter_batches(frames, batch_size):
     frame_numbers = []
     imgs = []
-    for img in video_reader:
+    for frame_number, img in frames:
         imgs.append(img)
-        frame_numbers.append(video_reader.frame_number)
+        frame_numbers.append(frame_number)
         if len(imgs) >= batch_size:
             yield frame_numbers, imgs
             frame_numbers = []
@@ -795,8 +1096,9 @@ def compute_embeddings(
         embeddings_field (None): the name of a field in which to store the
             embeddings. When computing video frame embeddings, the "frames."
             prefix is optional
-        batch_size (None): an optional batch size to use, if the model supports
-            batching
+        batch_size (None): an optional batch size to use, if the model
+            supports batching. By default, models that provide batched
+            inference are applied with a batch size of 16
         num_workers (None): the number of workers to use when loading images.
             Only applicable for Torch-based models
         skip_failures (True): whether to gracefully continue without raising an
@@ -900,7 +1202,8 @@ def compute_embeddings(
         if use_data_loader:
             context.enter_context(fou.SetAttributes(model, preprocess=False))
 
-        context.enter_context(model)
+        if not getattr(model, "_entered", False):
+            context.enter_context(model)
 
         samples = samples.select_fields()
 
@@ -958,17 +1261,23 @@ def _compute_image_embeddings_single(
     embeddings = []
     errors = False
 
+    # Bind hot attributes once outside the per-sample loop
+    embed = model.embed
+    input_dtype = _get_input_dtype(model)
+
     with contextlib.ExitStack() as context:
-        pb = context.enter_context(fou.ProgressBar(progress=progress))
+        pb = context.enter_context(fou.ProgressBar(samples, progress=progress))
         if embeddings_field is not None:
             ctx = context.enter_context(foc.SaveContext(samples))
 
-        for sample in pb(samples):
+        for sample, img in pb(_iter_images(samples, dtype=input_dtype)):
             embedding = None
 
             try:
-                img = foui.read(sample.filepath)
-                embedding = model.embed(img)
+                if isinstance(img, Exception):
+                    raise img
+
+                embedding = embed(img)
             except Exception as e:
                 if not skip_failures:
                     raise e
@@ -1106,6 +1415,9 @@ def _compute_frame_embeddings_single(
     frame_counts, total_frame_count = _get_frame_counts(samples)
     is_clips = samples._dataset._is_clips
 
+    # Bind hot attributes once outside the per-frame loops
+    embed = model.embed
+
     embeddings_dict = {}
 
     with contextlib.ExitStack() as context:
@@ -1124,15 +1436,15 @@ def _compute_frame_embeddings_single(
                 frames = None
 
             try:
-                with etav.FFmpegVideoReader(
+                with _open_video_reader(
                     sample.filepath, frames=frames
                 ) as video_reader:
-                    for img in video_reader:
-                        embedding = model.embed(img)
+                    for frame_number, img in _iter_video_frames(video_reader):
+                        embedding = embed(img)
 
                         if embeddings_field is not None:
                             sample.add_labels(
-                                {video_reader.frame_number: embedding},
+                                {frame_number: embedding},
                                 label_field=embeddings_field,
                             )
                             ctx.save(sample)
@@ -1188,10 +1500,12 @@ def _compute_frame_embeddings_batch(
                 frames = None
 
             try:
-                with etav.FFmpegVideoReader(
+                with _open_video_reader(
                     sample.filepath, frames=frames
                 ) as video_reader:
-                    for fns, imgs in _iter_batches(video_reader, batch_size):
+                    for fns, imgs in _iter_batches(
+                        _iter_video_frames(video_reader), batch_size
+                    ):
                         embeddings_batch = list(model.embed_all(imgs))
 
                         if embeddings_field is not None:
@@ -1253,7 +1567,7 @@ def _compute_video_embeddings(
                 frames = None
 
             try:
-                with etav.FFmpegVideoReader(
+                with _open_video_reader(
                     sample.filepath, frames=frames
                 ) as video_reader:
                     embedding = model.embed(video_reader)
@@ -1337,8 +1651,9 @@ def compute_patch_embeddings(
             -   "image": use the whole image as a single patch
             -   "error": raise an error
 
-        batch_size (None): an optional batch size to use, if the model supports
-            batching
+        batch_size (None): an optional batch size to use, if the model
+            supports batching. By default, models that provide batched
+            inference are applied with a batch size of 16
         num_workers (None): the number of workers to use when loading images.
             Only applicable for Torch models
         skip_failures (True): whether to gracefully continue without raising an
@@ -1442,7 +1757,8 @@ def compute_patch_embeddings(
         if use_data_loader:
             context.enter_context(fou.SetAttributes(model, preprocess=False))
 
-        context.enter_context(model)
+        if not getattr(model, "_entered", False):
+            context.enter_context(model)
 
         if samples.media_type == fom.VIDEO:
             _patches_field = samples._FRAMES_PREFIX + patches_field
@@ -1701,11 +2017,10 @@ def _embed_frame_patches(
             frame_embeddings_dict = {}
 
             try:
-                with etav.FFmpegVideoReader(
+                with _open_video_reader(
                     sample.filepath, frames=frames
                 ) as video_reader:
-                    for img in video_reader:
-                        frame_number = video_reader.frame_number
+                    for frame_number, img in _iter_video_frames(video_reader):
                         frame = sample.frames[frame_number]
 
                         embeddings = None
@@ -1804,9 +2119,27 @@ def _parse_batch_size(batch_size, model, use_data_loader):
     if batch_size is None:
         batch_size = fo.config.default_batch_size
 
-    if batch_size is not None and batch_size > 1 and model.ragged_batches:
-        logger.warning("Model does not support batching")
-        batch_size = None
+    implicit = False
+    if batch_size is None and _supports_batching(model):
+        # The model implements batched inference, so use it even though no
+        # explicit batch size was requested, deferring to any batch size the
+        # model itself advertises
+        batch_size = getattr(model, "batch_size", None) or _DEFAULT_BATCH_SIZE
+        implicit = True
+
+    if batch_size is not None and batch_size > 1:
+        if implicit:
+            # The user never requested batching, so quietly fall back to
+            # unbatched inference if the model can't (or won't say whether
+            # it can) handle batches
+            try:
+                if model.ragged_batches:
+                    batch_size = None
+            except NotImplementedError:
+                batch_size = None
+        elif model.ragged_batches:
+            logger.warning("Model does not support batching")
+            batch_size = None
 
     if use_data_loader and batch_size is None:
         batch_size = 1
@@ -1814,6 +2147,19 @@ def _parse_batch_size(batch_size, model, use_data_loader):
     return batch_size
 
 
+def _supports_batching(model):
+    # Detects models that provide a real batched ``predict_all``
+    # implementation rather than inheriting the default per-item loop
+    predict_all = getattr(type(model), "predict_all", None)
+    if predict_all is None:
+        return False
+
+    if isinstance(model, SamplesMixin):
+        return predict_all is not SamplesMixin.predict_all
+
+    return predict_all is not Model.predict_all
+
+
 def _make_label_parser(samples, patches_field):
     patches_attr, _ = samples._handle_frame_field(patches_field)
     label_type = samples._get_label_field_type(patches_field)
@@ -1862,14 +2208,22 @@ def load_model(model_config_dict, model_path=None, **kwargs):
         a :class:`Model` instance
     """
     # Inject config args
+    #
+    # Note that the merge operates on (shallow) copies so that the caller's
+    # dict is not mutated, and `model_path` is injected into the *parsed*
+    # config below so that sweeps over `model_path` share the same parsed
+    # config template
     if kwargs:
+        config_dict = dict(model_config_dict["config"])
+        model_config_dict = {**model_config_dict, "config": config_dict}
         if model_config_dict["type"] == etau.get_class_name(foue.ETAModel):
-            _merge_config(model_config_dict["config"]["config"], kwargs)
+            config_dict["config"] = dict(config_dict["config"])
+            _merge_config(config_dict["config"], kwargs)
         else:
-            _merge_config(model_config_dict["config"], kwargs)
+            _merge_config(config_dict, kwargs)
 
     # Load model config
-    config = ModelConfig.from_dict(model_config_dict)
+    config = _parse_model_config(model_config_dict)
 
     #
     # Inject model path
@@ -1901,10 +2255,30 @@ def load_model(model_config_dict, model_path=None, **kwargs):
     return config.build()
 
 
+def _parse_model_config(model_config_dict):
+    # Parsing a model config reflects into ETA's class loader, so workflows
+    # that repeatedly load the same base config benefit from caching the
+    # parsed template and handing out copies that callers can freely mutate
+    try:
+        key = json.dumps(model_config_dict, sort_keys=True)
+        return copy.deepcopy(_parse_model_config_cached(key))
+    except Exception:
+        return ModelConfig.from_dict(model_config_dict)
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_model_config_cached(config_json):
+    return ModelConfig.from_dict(json.loads(config_json))
+
+
 def _merge_config(d, kwargs):
+    if not kwargs:
+        return
+
     for k, v in kwargs.items():
-        if k in d and isinstance(d[k], dict):
-            d[k].update(v)
+        curr = d.get(k)
+        if isinstance(curr, dict) and isinstance(v, dict):
+            d[k] = curr | v
         else:
             d[k] = v
 
@@ -1933,13 +2307,20 @@ class Model(etal.Model):
             models can optionally use context to perform any necessary setup
             and teardown, and so any code that builds a model should use the
             ``with`` syntax
+
+    Callers that apply a model repeatedly can enter its context themselves to
+    keep the model warm; methods like :func:`apply_model` detect an
+    already-entered model and will not re-enter (or tear down) its context.
     """
 
+    _entered = False
+
     def __enter__(self):
+        self._entered = True
         return self
 
     def __exit__(self, *args):
-        pass
+        self._entered = False
 
     @property
     def media_type(self):
@@ -1979,6 +2360,17 @@ class Model(etal.Model):
         """
         return False
 
+    @property
+    def input_dtype(self):
+        """The numpy dtype in which this model expects image data.
+
+        By default, this is ``numpy.uint8``, matching the contract described
+        in :meth:`predict`. Models with reduced-precision or quantized data
+        paths can override this so that callers deliver fp16/bf16/int8
+        buffers directly, avoiding a cast inside the model.
+        """
+        return np.uint8
+
     @property
     def ragged_batches(self):
         """True/False whether :meth:`transforms` may return tensors of
@@ -2098,8 +2490,9 @@ class EmbeddingsMixin(object):
         model.
 
         By convention, this method should always return an array whose first
-        axis represents batch size (which will always be 1 when :meth:`predict`
-        was last used).
+        axis represents batch size, which will always be 1 when
+        :meth:`predict` was last used and the number of inputs when
+        :meth:`predict_all` was last used.
 
         Returns:
             a numpy array containing the embedding(s)
@@ -2126,9 +2519,13 @@ class EmbeddingsMixin(object):
     def embed_all(self, args):
         """Generates embeddings for the given iterable of data.
 
-        Subclasses can override this method to increase efficiency, but, by
-        default, this method simply iterates over the data and applies
-        :meth:`embed` to each.
+        If the model provides a batched :meth:`Model.predict_all`
+        implementation, this method performs a single forward pass over the
+        batch and retrieves all embeddings via :meth:`get_embeddings`.
+        Otherwise, the data is iterated over and :meth:`embed` is applied to
+        each element.
+
+        Subclasses can override this method to increase efficiency.
 
         Args:
             args: an iterable of data. See :meth:`predict_all` for details
@@ -2136,7 +2533,31 @@ class EmbeddingsMixin(object):
         Returns:
             a numpy array containing the embeddings stacked along axis 0
         """
-        return np.stack([self.embed(arg) for arg in args])
+        args = list(args)
+
+        if _supports_batching(self):
+            # pylint: disable=no-member
+            self.predict_all(args)
+            embeddings = self.get_embeddings()
+            if embeddings is not None and len(embeddings) == len(args):
+                return np.asarray(embeddings)
+
+        # Write each embedding into a preallocated output array rather than
+        # accumulating a list and copying it via `np.stack`
+        out = None
+        for idx, arg in enumerate(args):
+            embedding = np.asarray(self.embed(arg))
+            if out is None:
+                out = np.empty(
+                    (len(args),) + embedding.shape, dtype=embedding.dtype
+                )
+
+            out[idx] = embedding
+
+        if out is None:
+            return np.stack([])
+
+        return out
 
 
 class PromptMixin(object):
@@ -2269,7 +2690,48 @@ class TorchModelMixin(object):
     applied to each input before prediction.
     """
 
-    pass
+    @property
+    def memory_format(self):
+        """An optional ``torch.memory_format`` in which batch tensors (and the
+        model's weights) should be laid out for inference.
+
+        This property returns ``None`` by default, which preserves Torch's
+        default (contiguous) layout. Subclasses can return
+        ``torch.channels_last`` to enable NHWC fast paths for convolutional
+        models.
+        """
+        return None
+
+    @property
+    def accepts_gpu_tensor(self):
+        """Whether this model can directly consume ``torch.Tensor`` batches
+        that already reside on its device.
+
+        This property returns ``False`` by default. Subclasses that return
+        ``True`` must implement :meth:`predict_tensor`, and callers may then
+        pass device tensors directly, skipping the numpy conversion and
+        host-to-device staging performed by :meth:`Model.transforms`.
+        """
+        return False
+
+    def predict_tensor(self, tensor):
+        """Performs prediction on the given preprocessed ``torch.Tensor``
+        batch, which may already reside on the model's device.
+
+        Only applicable when :meth:`accepts_gpu_tensor` is ``True``.
+
+        Args:
+            tensor: a ``torch.Tensor`` batch of preprocessed inputs
+
+        Returns:
+            a list of :class:`fiftyone.core.labels.Label` instances or a list
+            of dicts of :class:`fiftyone.core.labels.Label` instances
+            containing the predictions
+        """
+        raise NotImplementedError(
+            "subclasses declaring accepts_gpu_tensor must implement "
+            "predict_tensor()"
+        )
 
 
 class ModelManagerConfig(etam.ModelManagerConfig):
@@ -2296,19 +2758,59 @@ class ModelManagerConfig(etam.ModelManagerConfig):
 class ModelManager(etam.ModelManager):
     """Class for downloading FiftyOne models from the web."""
 
+    # Model weights are large, so stream them to disk in 1 MiB chunks rather
+    # than the default (much smaller) chunk size
+    _CHUNK_SIZE = 1024 * 1024
+
     @staticmethod
     def upload_model(model_path, *args, **kwargs):
         raise NotImplementedError("Uploading models via API is not supported")
 
+    @classmethod
+    def download_many(cls, tasks, num_workers=4, force=False):
+        """Downloads multiple models concurrently.
+
+        Independent downloads are I/O-bound, so fanning them out over a small
+        thread pool hides the per-file round-trip latency.
+
+        Args:
+            tasks: an iterable of ``(manager, model_path)`` tuples
+            num_workers (4): the number of concurrent downloads
+            force (False): whether to force download each model. See
+                ``download_model()`` for details
+        """
+        tasks = list(tasks)
+
+        if len(tasks) <= 1 or num_workers <= 1:
+            for manager, model_path in tasks:
+                manager.download_model(model_path, force=force)
+
+            return
+
+        num_workers = min(num_workers, len(tasks))
+        with ThreadPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                executor.submit(
+                    manager.download_model, model_path, force=force
+                )
+                for manager, model_path in tasks
+            ]
+            for future in futures:
+                future.result()
+
     def _download_model(self, model_path):
         if self.config.google_drive_id:
             gid = self.config.google_drive_id
             logger.info("Downloading model from Google Drive ID '%s'...", gid)
-            etaw.download_google_drive_file(gid, path=model_path)
+            etaw.download_google_drive_file(
+                gid, path=model_path, chunk_size=self._CHUNK_SIZE
+            )
         elif self.config.url:
             url = self.config.url
             logger.info("Downloading model from '%s'...", url)
-            etaw.download_file(url, path=model_path)
+            etaw.download_file(
+                url, path=model_path, chunk_size=self._CHUNK_SIZE
+            )
         else:
             logger.info("This model's downloading is not managed by FiftyOne")
 
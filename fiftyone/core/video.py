@@ -6,6 +6,7 @@ Video frame views.
 |
 """
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
 import logging
 import os
@@ -31,6 +32,15 @@ fouv = fou.lazy_import("fiftyone.utils.video")
 
 logger = logging.getLogger(__name__)
 
+_INSERT_BATCH_SIZE = 10000
+
+# Shared read-only stand-in for missing `metadata`
+_EMPTY_METADATA = {}
+
+# Fields that are listed first in frames dataset summaries
+_PRETTY_FIELDS = ("id", "sample_id", "filepath", "frame_number")
+_PRETTY_FIELDS_SET = frozenset(_PRETTY_FIELDS)
+
 
 class FrameView(fos.SampleView):
     """A frame in a :class:`FramesView`.
@@ -86,6 +96,8 @@ class FramesView(fov.DatasetView):
         "_source_collection",
         "_frames_stage",
         "_frames_dataset",
+        "_sample_only_fields_cache",
+        "_last_synced_schema",
         "__stages",
         "__media_type",
         "__name",
@@ -106,6 +118,8 @@ class FramesView(fov.DatasetView):
         self._source_collection = source_collection
         self._frames_stage = frames_stage
         self._frames_dataset = frames_dataset
+        self._sample_only_fields_cache = {}
+        self._last_synced_schema = None
         self.__stages = _stages
         self.__media_type = _media_type
         self.__name = _name
@@ -176,19 +190,31 @@ class FramesView(fov.DatasetView):
     def _get_sample_only_fields(
         self, include_private=False, use_db_fields=False
     ):
-        sample_only_fields = set(
-            self._get_default_sample_fields(
-                include_private=include_private, use_db_fields=use_db_fields
+        # These fields are static for the lifetime of the view, so they are
+        # computed at most once per (include_private, use_db_fields)
+        key = (include_private, use_db_fields)
+        sample_only_fields = self._sample_only_fields_cache.get(key, None)
+
+        if sample_only_fields is None:
+            sample_only_fields = set(
+                self._get_default_sample_fields(
+                    include_private=include_private,
+                    use_db_fields=use_db_fields,
+                )
             )
-        )
-        sample_only_fields.discard("last_modified_at")
+            sample_only_fields.discard("last_modified_at")
 
-        # If sample_frames != dynamic, `filepath` can be synced
-        config = self._frames_stage.config or {}
-        if config.get("sample_frames", None) != "dynamic":
-            sample_only_fields.discard("filepath")
+            # If sample_frames != dynamic, `filepath` can be synced
+            config = self._frames_stage.config or {}
+            if config.get("sample_frames", None) != "dynamic":
+                sample_only_fields.discard("filepath")
 
-        return sample_only_fields
+            self._sample_only_fields_cache[key] = frozenset(
+                sample_only_fields
+            )
+
+        # Callers may mutate the result, so return a copy
+        return set(sample_only_fields)
 
     def _tag_labels(self, tags, label_field, ids=None, label_ids=None):
         ids, label_ids = super()._tag_labels(
@@ -211,17 +237,26 @@ class FramesView(fov.DatasetView):
         )
 
     def set_values(self, field_name, *args, **kwargs):
+        # Sample-only fields are never synced, so don't bother recording IDs
+        # or running the sync pipeline when one is updated
+        field = field_name.split(".", 1)[0]
+        must_sync = field not in self._get_sample_only_fields(
+            include_private=True
+        )
+
         # The `set_values()` operation could change the contents of this view,
-        # so we first record the sample IDs that need to be synced
-        if self._stages:
-            ids = self.values("id")
+        # so we first record the sample IDs that need to be synced. The raw
+        # `_id` values are used so no ObjectId <-> str conversions are needed
+        if must_sync and self._stages:
+            ids = self.values("_id")
         else:
             ids = None
 
         super().set_values(field_name, *args, **kwargs)
 
-        field = field_name.split(".", 1)[0]
-        self._sync_source(fields=[field], ids=ids)
+        if must_sync:
+            self._sync_source(fields=[field], ids=ids)
+
         self._sync_source_field_schema(field_name)
 
     def set_label_values(self, field_name, *args, **kwargs):
@@ -244,6 +279,16 @@ class FramesView(fov.DatasetView):
             This will permanently delete any omitted or filtered contents from
             the frames of the source dataset.
 
+        .. note::
+
+            Calling this method (or using
+            :meth:`save_context() <fiftyone.core.collections.SampleCollection.save_context>`)
+            syncs all changes to the source dataset via a single server-side
+            pipeline, which is far more efficient than iterating over the view
+            and calling
+            :meth:`save() <fiftyone.core.sample.SampleView.save>` on each
+            frame, which issues one sync per frame.
+
         Args:
             fields (None): an optional field or list of fields to save. If
                 specified, only these fields are overwritten
@@ -304,6 +349,8 @@ class FramesView(fov.DatasetView):
         self._frames_dataset.delete()
         _view = self._frames_stage.load_view(self._source_collection)
         self._frames_dataset = _view._frames_dataset
+        self._sample_only_fields_cache.clear()
+        self._last_synced_schema = None
 
         super().reload()
 
@@ -328,9 +375,14 @@ class FramesView(fov.DatasetView):
         self._source_collection._delete_labels(ids, fields=frame_fields)
 
     def _sync_source_sample(self, sample):
-        self._sync_source_schema()
+        # Schema changes are rare relative to per-frame saves, so the schema
+        # sync is only performed when this view's schema has changed since the
+        # last sync
+        schema_keys = self._frames_dataset._sample_doc_cls._fields_ordered
+        if schema_keys != self._last_synced_schema:
+            self._sync_source_schema()
+            self._last_synced_schema = schema_keys
 
-        dst_dataset = self._source_collection._root_dataset
         sample_only_fields = self._get_sample_only_fields(
             include_private=True, use_db_fields=True
         )
@@ -349,6 +401,7 @@ class FramesView(fov.DatasetView):
             "frame_number": sample.frame_number,
         }
 
+        dst_dataset = self._source_collection._root_dataset
         dst_dataset._frame_collection.update_one(match, {"$set": updates})
 
     def _sync_source(self, fields=None, ids=None, update=True, delete=False):
@@ -368,13 +421,7 @@ class FramesView(fov.DatasetView):
             pipeline = []
 
             if ids is not None:
-                pipeline.append(
-                    {
-                        "$match": {
-                            "_id": {"$in": [ObjectId(_id) for _id in ids]}
-                        }
-                    }
-                )
+                pipeline.append({"$match": {"_id": {"$in": _as_oids(ids)}}})
 
             if fields is None:
                 sample_only_fields.discard("_sample_id")
@@ -420,11 +467,6 @@ class FramesView(fov.DatasetView):
             self._source_collection._sync_source_field_schema(path)
 
     def _sync_source_schema(self, fields=None, delete=False):
-        if delete:
-            schema = self.get_field_schema()
-        else:
-            schema = self._frames_dataset.get_field_schema()
-
         src_schema = self._source_collection.get_frame_field_schema()
         dst_dataset = self._source_collection._root_dataset
 
@@ -438,7 +480,19 @@ class FramesView(fov.DatasetView):
             for field_name in fields:
                 if field_name not in src_schema:
                     add_fields.append(field_name)
+
+            if not add_fields:
+                # All fields already exist in the source collection, so we
+                # can skip building this view's schema entirely
+                return
+
+            schema = self._frames_dataset.get_field_schema()
         else:
+            if delete:
+                schema = self.get_field_schema()
+            else:
+                schema = self._frames_dataset.get_field_schema()
+
             # We're syncing all fields; add any missing fields to source
             # collection and, if requested, delete any source fields that
             # aren't in this view
@@ -459,13 +513,13 @@ class FramesView(fov.DatasetView):
                     if field_name not in schema:
                         del_fields.append(field_name)
 
-        for field_name in add_fields:
-            field_kwargs = foo.get_field_kwargs(schema[field_name])
-            dst_dataset.add_frame_field(field_name, **field_kwargs)
+        if add_fields:
+            dst_dataset._merge_frame_field_schema(
+                {field_name: schema[field_name] for field_name in add_fields}
+            )
 
-        if delete:
-            for field_name in del_fields:
-                dst_dataset.delete_frame_field(field_name)
+        if delete and del_fields:
+            dst_dataset.delete_frame_fields(del_fields)
 
     def _sync_source_keep_fields(self):
         schema = self.get_field_schema()
@@ -637,6 +691,22 @@ def make_frames_dataset(
             fo.config.default_sequence_idx + fo.config.default_image_ext
         )
 
+    #
+    # We'll need frame counts to determine what frames to include/sample; the
+    # (potentially long) metadata computation is run on a background thread so
+    # that it overlaps with the dataset creation below
+    #
+
+    meta_future = None
+    if (
+        (sample_frames != False and not sparse)
+        or fps is not None
+        or max_fps is not None
+    ):
+        executor = ThreadPoolExecutor(max_workers=1)
+        meta_future = executor.submit(sample_collection.compute_metadata)
+        executor.shutdown(wait=False)
+
     #
     # Create dataset with proper schema
     #
@@ -656,6 +726,9 @@ def make_frames_dataset(
 
     _make_pretty_summary(dataset)
 
+    if meta_future is not None:
+        meta_future.result()
+
     # Initialize frames dataset
     sample_view, frames_to_sample = _init_frames(
         dataset,
@@ -692,27 +765,32 @@ def make_frames_dataset(
     #
     # Merge frame data
     #
+    # The `$merge` discards unmatched documents, so when no frame docs were
+    # created the aggregation would be a no-op pass over every source frame;
+    # skip it entirely in that case
+    #
 
-    pipeline = []
+    if len(dataset) > 0:
+        pipeline = []
 
-    if sample_frames == "dynamic":
-        pipeline.append({"$project": {"filepath": False}})
+        if sample_frames == "dynamic":
+            pipeline.append({"$project": {"filepath": False}})
 
-    pipeline.extend(
-        [
-            {"$addFields": {"_dataset_id": dataset._doc.id}},
-            {
-                "$merge": {
-                    "into": dataset._sample_collection_name,
-                    "on": ["_sample_id", "frame_number"],
-                    "whenMatched": "merge",
-                    "whenNotMatched": "discard",
-                }
-            },
-        ]
-    )
+        pipeline.extend(
+            [
+                {"$addFields": {"_dataset_id": dataset._doc.id}},
+                {
+                    "$merge": {
+                        "into": dataset._sample_collection_name,
+                        "on": ["_sample_id", "frame_number"],
+                        "whenMatched": "merge",
+                        "whenNotMatched": "discard",
+                    }
+                },
+            ]
+        )
 
-    sample_collection._aggregate(frames_only=True, post_pipeline=pipeline)
+        sample_collection._aggregate(frames_only=True, post_pipeline=pipeline)
 
     if sample_frames == False and not dataset:
         logger.warning(
@@ -727,11 +805,21 @@ def make_frames_dataset(
     return dataset
 
 
+def _as_oids(ids):
+    if not isinstance(ids, (list, tuple)):
+        ids = list(ids)
+
+    if ids and isinstance(ids[0], ObjectId):
+        return ids
+
+    return [ObjectId(_id) for _id in ids]
+
+
 def _make_pretty_summary(dataset):
-    set_fields = ["id", "sample_id", "filepath", "frame_number"]
     all_fields = dataset._sample_doc_cls._fields_ordered
-    pretty_fields = set_fields + [f for f in all_fields if f not in set_fields]
-    dataset._sample_doc_cls._fields_ordered = tuple(pretty_fields)
+    dataset._sample_doc_cls._fields_ordered = _PRETTY_FIELDS + tuple(
+        f for f in all_fields if f not in _PRETTY_FIELDS_SET
+    )
 
 
 def _init_frames(
@@ -747,14 +835,6 @@ def _init_frames(
     force_sample,
     verbose,
 ):
-    if (
-        (sample_frames != False and not sparse)
-        or fps is not None
-        or max_fps is not None
-    ):
-        # We'll need frame counts to determine what frames to include/sample
-        src_collection.compute_metadata()
-
     if sample_frames == True and verbose:
         logger.info("Determining frames to sample...")
 
@@ -801,29 +881,54 @@ def _init_frames(
             ).values(["_id", "frames.frame_number"])
             has_filepaths_map = {_id: set(_fns) for _id, _fns in zip(ids, fns)}
 
-    for sample in view._aggregate(attach_frames=True):
+    _dataset_id = dataset._doc.id
+
+    # Only project the fields consumed by the loop below so that bookkeeping
+    # fields aren't shipped for every frame of every video
+    project = {
+        "filepath": True,
+        "tags": True,
+        "metadata.frame_rate": True,
+        "metadata.total_frame_count": True,
+        "frames._id": True,
+        "frames.frame_number": True,
+        "frames.filepath": True,
+        "_sample_id": True,
+        "support": True,
+    }
+
+    for sample in view._aggregate(
+        attach_frames=True, post_pipeline=[{"$project": project}]
+    ):
         video_path = sample["filepath"]
-        tags = sample.get("tags", [])
-        metadata = sample.get("metadata", None) or {}
-        frame_rate = metadata.get("frame_rate", None)
+        tags = sample.get("tags") or []
+        metadata = sample.get("metadata") or _EMPTY_METADATA
+        frame_rate = metadata.get("frame_rate")
         total_frame_count = metadata.get("total_frame_count", -1)
-        frames = sample.get("frames", [])
+        frames = sample.get("frames") or ()
 
-        frame_ids_map = {}
+        # The `sample_frames` checks are hoisted out of the loop, and the
+        # doc/filepath bookkeeping is skipped entirely when it isn't needed
         frames_with_docs = set()
         frames_with_filepaths = set()
-        for frame in frames:
-            _frame_id = frame["_id"]
-            fn = frame["frame_number"]
-            filepath = frame.get("filepath", None)
-
-            if sample_frames != False or filepath is not None:
-                frame_ids_map[fn] = _frame_id
-
-            if sample_frames == True:
+        if sample_frames == True:
+            frame_ids_map = {}
+            for frame in frames:
+                fn = frame["frame_number"]
+                frame_ids_map[fn] = frame["_id"]
                 frames_with_docs.add(fn)
-                if filepath is not None:
+                if frame.get("filepath", None) is not None:
                     frames_with_filepaths.add(fn)
+        elif sample_frames == False:
+            frame_ids_map = {
+                frame["frame_number"]: frame["_id"]
+                for frame in frames
+                if frame.get("filepath", None) is not None
+            }
+        else:
+            frame_ids_map = {
+                frame["frame_number"]: frame["_id"] for frame in frames
+            }
 
         if is_clips:
             _sample_id = sample["_sample_id"]
@@ -855,14 +960,16 @@ def _init_frames(
         )
 
         # Record things that need to be sampled
-        # Note: [] means no frames, None means all frames
-        if sample_frame_numbers != []:
+        # Note: empty means no frames, None means all frames
+        if sample_frame_numbers is None or len(sample_frame_numbers) > 0:
             id_map[video_path] = str(_sample_id)
 
             if sample_frame_numbers is None:
                 sample_map[video_path] = None
-            elif sample_map[video_path] is not None:
-                sample_map[video_path].update(sample_frame_numbers)
+            else:
+                _sample_fns = sample_map[video_path]
+                if _sample_fns is not None:
+                    _sample_fns.update(sample_frame_numbers)
 
         # Determine if any docs/filepaths are missing from the source dataset
         if sample_frames == True:
@@ -880,39 +987,51 @@ def _init_frames(
             missing_fps = None
 
         # Create necessary frame documents
+        #
+        # The static fields are precomputed once per video in a template dict
+        # that is copied per frame, which is measurably cheaper than building
+        # each doc from scratch for videos with many frames
+        is_dynamic = sample_frames == "dynamic"
+        base_doc = {
+            "filepath": video_path if is_dynamic else None,
+            "tags": tags,
+            "metadata": None,
+            "frame_number": None,
+            "_media_type": "image",
+            "_rand": None,
+            "_sample_id": _sample_id,
+            "_dataset_id": _dataset_id,
+        }
+
+        # For clips, the same video's frame set is consulted for every frame,
+        # so look it up once rather than once per frame
+        fns = frame_map[video_path] if is_clips else None
+
+        # Binding the format operator once avoids re-parsing the pattern
+        # string on every frame
+        _frame_path = images_patt.__mod__
+
         for fn in doc_frame_numbers:
-            if is_clips:
-                fns = frame_map[video_path]
+            if fns is not None:
                 if fn in fns:
                     continue  # frame has already been sampled
 
                 fns.add(fn)
 
             _id = frame_ids_map.get(fn, None)
-            _filepath = images_patt % fn
-            _rand = foos._generate_rand(_filepath)
-            _dataset_id = dataset._doc.id
+            _filepath = _frame_path(fn)
 
             if missing_fps is not None and fn in missing_fps:
                 missing_filepaths.append((_sample_id, fn, _filepath))
 
-            if sample_frames == "dynamic":
-                filepath = video_path
-            else:
+            doc = base_doc.copy()
+            doc["frame_number"] = fn
+            doc["_rand"] = foos._generate_rand(_filepath)
+
+            if not is_dynamic:
                 # This will be overwritten in the final merge if the actual
                 # filepath is different
-                filepath = _filepath
-
-            doc = {
-                "filepath": filepath,
-                "tags": tags,
-                "metadata": None,
-                "frame_number": fn,
-                "_media_type": "image",
-                "_rand": _rand,
-                "_sample_id": _sample_id,
-                "_dataset_id": _dataset_id,
-            }
+                doc["filepath"] = _filepath
 
             if _id is not None:
                 doc["_id"] = _id
@@ -927,7 +1046,7 @@ def _init_frames(
             docs.append(doc)
 
             # Commit batch of docs to frames dataset
-            if len(docs) >= 10000:
+            if len(docs) >= _INSERT_BATCH_SIZE:
                 _insert_docs(docs, src_docs, src_inds, dataset, src_dataset)
 
     # Add remaining docs to frames dataset
@@ -1023,7 +1142,7 @@ def _parse_video_frames(
         )
     elif support is not None:
         first, last = support
-        target_frame_numbers = list(range(first, last + 1))
+        target_frame_numbers = range(first, last + 1)
     else:
         target_frame_numbers = None  # all frames
 
@@ -1035,7 +1154,9 @@ def _parse_video_frames(
         if total_frame_count < 0:
             doc_frame_numbers = sorted(frame_ids_map.keys())
         else:
-            doc_frame_numbers = list(range(1, total_frame_count + 1))
+            # A `range` suffices here; downstream consumers only iterate,
+            # take lengths, and test membership
+            doc_frame_numbers = range(1, total_frame_count + 1)
     else:
         doc_frame_numbers = target_frame_numbers
 
@@ -1073,7 +1194,7 @@ def _parse_video_frames(
                 count,
                 video_path,
             )
-        elif sample_frame_numbers != []:
+        elif len(sample_frame_numbers) > 0:
             logger.info(
                 "Must sample %d/%s frames of '%s'",
                 len(sample_frame_numbers),
@@ -1087,4 +1208,24 @@ def _parse_video_frames(
 
 
 def _get_non_existent_frame_numbers(images_patt, frame_numbers):
-    return [fn for fn in frame_numbers if not os.path.isfile(images_patt % fn)]
+    # Listing the frames directory once is much cheaper than issuing one
+    # `isfile` stat per frame number
+    outdir, patt = os.path.split(images_patt)
+
+    if "%" not in patt:
+        # Pattern's placeholder is not in the basename; fall back to stat-ing
+        # each frame path
+        return [
+            fn for fn in frame_numbers if not os.path.isfile(images_patt % fn)
+        ]
+
+    try:
+        existing = set(os.listdir(outdir))
+    except OSError:
+        return list(frame_numbers)
+
+    if not existing:
+        return list(frame_numbers)
+
+    _name = patt.__mod__
+    return [fn for fn in frame_numbers if _name(fn) not in existing]
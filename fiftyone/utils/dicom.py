@@ -8,7 +8,8 @@ DICOM utilities.
 
 import logging
 import os
-import warnings
+import queue
+import threading
 
 import numpy as np
 
@@ -17,13 +18,29 @@ import eta.core.utils as etau
 import fiftyone.core.utils as fou
 import fiftyone.utils.data as foud
 
-fou.ensure_package("pydicom<3")
-import pydicom
-from pydicom.fileset import FileInstance, FileSet
+pydicom = fou.lazy_import(
+    "pydicom", callback=lambda: fou.ensure_package("pydicom<3")
+)
+pydfs = fou.lazy_import(
+    "pydicom.fileset", callback=lambda: fou.ensure_package("pydicom<3")
+)
 
 
 logger = logging.getLogger(__name__)
 
+# PixelData and DataSetTrailingPadding, which are never included in labels
+_SKIP_TAGS = {0x7FE00010, 0xFFFCFFFC}
+
+# FloatPixelData, DoubleFloatPixelData, and PixelData
+_PIXEL_TAGS = (0x7FE00008, 0x7FE00009, 0x7FE00010)
+
+# Element values larger than this are read lazily from disk
+_DEFER_SIZE = 4096
+
+# pydicom issues many small reads while parsing, so a large buffer
+# drastically reduces the syscall count
+_READ_BUFFER_SIZE = 1 << 20
+
 
 class DICOMSampleParser(foud.LabeledImageSampleParser):
     """Parser for labeled image samples stored in
@@ -48,6 +65,33 @@ class DICOMSampleParser(foud.LabeledImageSampleParser):
         self.keywords = keywords
         self.parsers = parsers
         self._ds = None
+        self._ds_has_pixels = False
+        self._warned = set()
+
+        # Shape-keyed float32 scratch buffers reused by `_get_image` across
+        # samples
+        self._scratch = {}
+
+        if keywords is not None:
+            # Pre-resolve each keyword's tag and parser once; integer-tag
+            # lookups bypass the per-call keyword resolution in `Dataset.get`
+            self._field_plan = [
+                (
+                    kw,
+                    pydicom.datadict.tag_for_keyword(kw),
+                    parsers.get(kw) if parsers is not None else None,
+                )
+                for kw in keywords
+            ]
+
+            # Unknown keywords can never yield values, so they are simply
+            # omitted from the metadata-only reads
+            self._specific_tags = [
+                tag for _, tag, _ in self._field_plan if tag is not None
+            ] or None
+        else:
+            self._field_plan = None
+            self._specific_tags = None
 
     @property
     def label_cls(self):
@@ -62,59 +106,119 @@ class DICOMSampleParser(foud.LabeledImageSampleParser):
         return False
 
     def get_image(self):
-        self._ensure_ds()
-        return _get_image(self._ds)
+        self._ensure_ds(need_pixels=True)
+        try:
+            return _get_image(self._ds, scratch=self._scratch)
+        finally:
+            self._release_pixels()
 
     def get_label(self):
         self._ensure_ds()
 
-        if self.keywords is not None:
-            fields = self.keywords
-            blacklist = set()
+        label = {}
+
+        # Bind the hot attribute lookups once outside the per-field loops
+        _get = self._ds.get
+        _add_field = self._add_field
+
+        if self._field_plan is not None:
+            for kw, tag, parser in self._field_plan:
+                if tag is not None:
+                    elem = _get(tag)
+                    value = elem.value if elem is not None else None
+                else:
+                    value = _get(kw, default=None)
+
+                _add_field(label, kw, value, parser=parser)
         else:
-            fields = self._ds.dir()
-            blacklist = {"PixelData", "DataSetTrailingPadding"}
+            # Iterating the elements directly avoids the sorted full-keyword
+            # scan and the per-keyword re-lookup that `ds.dir()` would incur
+            parsers = self.parsers
+            for elem in self._ds:
+                if elem.tag in _SKIP_TAGS:
+                    continue
 
-        label = {}
+                kw = elem.keyword
+                if not kw:
+                    # private or unknown tag
+                    continue
 
-        for kw in fields:
-            if kw in blacklist:
-                continue
+                parser = parsers.get(kw) if parsers is not None else None
+                _add_field(label, kw, elem.value, parser=parser)
 
-            value = self._ds.get(kw, default=None)
+        return label
 
-            if self.parsers is not None and kw in self.parsers:
-                parser = self.parsers[kw]
-                value = parser(value)
+    def _add_field(self, label, kw, value, parser=None):
+        if parser is not None:
+            value = parser(value)
 
-            if value is None:
-                continue
+        if value is None:
+            return
 
-            _value, success = _to_python(value)
+        _value, success = _to_python(value)
 
-            if not success:
-                msg = "Ignoring field '%s' with unsupported type %s" % (
+        if not success:
+            # Unsupported fields typically recur in every file, so only warn
+            # the first time each (field, type) combination is seen
+            key = (kw, type(value))
+            if key not in self._warned:
+                self._warned.add(key)
+                logger.warning(
+                    "Ignoring field '%s' with unsupported type %s",
                     kw,
                     type(value),
                 )
-                warnings.warn(msg)
-                continue
 
-            label[kw] = _value
+            return
 
-        return label
+        label[kw] = _value
+
+    def _release_pixels(self):
+        # The (often huge) pixel data is no longer needed once the image has
+        # been rendered, so drop it and pydicom's decoded-array cache to bound
+        # the parser's memory footprint. `_ds_has_pixels` is reset so any
+        # subsequent `get_image` call re-reads the file
+        ds = self._ds
+        for tag in _PIXEL_TAGS:
+            if tag in ds:
+                del ds[tag]
+
+        ds._pixel_array = None
+        ds._pixel_id = {}
+        self._ds_has_pixels = False
 
     def clear_sample(self):
         super().clear_sample()
         self._ds = None
+        self._ds_has_pixels = False
 
-    def _ensure_ds(self):
-        if self._ds is None:
-            if isinstance(self.current_sample, FileInstance):
-                self._ds = self.current_sample.load()
-            else:
-                with open(self.current_sample, "rb") as f:
-                    self._ds = pydicom.dcmread(f)
+    def _ensure_ds(self, need_pixels=False):
+        if self._ds is not None and (self._ds_has_pixels or not need_pixels):
+            return
+
+        if isinstance(self.current_sample, pydfs.FileInstance):
+            path = self.current_sample.path
+        else:
+            path = self.current_sample
+
+        if need_pixels:
+            # Deferring large values keeps `PixelData` on disk, where
+            # `_memmap_pixels` can often map it directly; `pixel_array`
+            # transparently reads it back for files that don't qualify
+            with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+                self._ds = pydicom.dcmread(f, defer_size=_DEFER_SIZE)
+        else:
+            # Metadata-only passes don't need to read (let alone decode) the
+            # often enormous pixel data, and when specific keywords were
+            # requested, all other tags can be skipped too
+            with open(path, "rb", buffering=_READ_BUFFER_SIZE) as f:
+                self._ds = pydicom.dcmread(
+                    f,
+                    stop_before_pixels=True,
+                    specific_tags=self._specific_tags,
+                )
+
+        self._ds_has_pixels = need_pixels
 
 
 class DICOMDatasetImporter(
@@ -209,7 +313,9 @@ class DICOMDatasetImporter(
         return self._num_samples
 
     def __iter__(self):
-        self._iter_dataset_ingestor = iter(self._dataset_ingestor)
+        self._iter_dataset_ingestor = _iter_prefetch(
+            iter(self._dataset_ingestor)
+        )
         return self
 
     def __next__(self):
@@ -230,11 +336,15 @@ class DICOMDatasetImporter(
     def setup(self):
         if os.path.isfile(self.dicom_path):
             if not os.path.splitext(self.dicom_path)[1]:
-                # DICOMDIR file
-                with open(self.dicom_path, "rb") as f:
+                # DICOMDIR file. The `FileSet` is kept as-is so that its
+                # (potentially thousands of) instances are yielded lazily
+                # during iteration rather than materialized up front
+                with open(
+                    self.dicom_path, "rb", buffering=_READ_BUFFER_SIZE
+                ) as f:
                     ds = pydicom.dcmread(f)
 
-                samples = list(FileSet(ds))
+                samples = pydfs.FileSet(ds)
             else:
                 # Single DICOM file
                 samples = [self.dicom_path]
@@ -242,8 +352,13 @@ class DICOMDatasetImporter(
             # Glob pattern of DICOM files
             samples = etau.get_glob_matches(self.dicom_path)
 
+        num_samples = len(samples)
+        if self.max_samples is not None:
+            num_samples = min(num_samples, self.max_samples)
+
+        # May return a lazy iterable when no shuffling is required
         samples = self._preprocess_list(samples)
-        self._num_samples = len(samples)
+        self._num_samples = num_samples
 
         self._dataset_ingestor = foud.LabeledImageDatasetIngestor(
             self.images_dir,
@@ -257,54 +372,221 @@ class DICOMDatasetImporter(
         self._dataset_ingestor.close(*args)
 
 
-def _get_image(ds):
+def _iter_prefetch(iterable, queue_depth=8):
+    # Runs the (I/O and decode heavy) iterable on a background thread so that
+    # parsing and ingesting the next sample overlaps with the caller's
+    # downstream processing of the current one
+    result_queue = queue.Queue(maxsize=queue_depth)
+    stop = threading.Event()
+    done = object()
+
+    def _put(item):
+        while not stop.is_set():
+            try:
+                result_queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+
+        return False
+
+    def _produce():
+        try:
+            for item in iterable:
+                if not _put(item):
+                    return
+        except Exception as e:
+            _put(e)
+            return
+
+        _put(done)
+
+    thread = threading.Thread(target=_produce, daemon=True)
+    thread.start()
+
+    try:
+        while True:
+            item = result_queue.get()
+            if item is done:
+                return
+
+            if isinstance(item, Exception):
+                raise item
+
+            yield item
+    finally:
+        stop.set()
+        thread.join()
+
+
+def _get_image(ds, scratch=None):
     # @todo allow non 8-bit images here?
 
-    img = ds.pixel_array
+    img = _memmap_pixels(ds)
+    if img is None:
+        img = ds.pixel_array
 
-    low = ds.get("SmallestImagePixelValue", 0)
+    # Plain ints keep the scale arithmetic below out of numpy scalar ops
+    low = int(ds.get("SmallestImagePixelValue", 0))
     high = ds.get("LargestImagePixelValue", None)
-    if high is None:
-        high = img.max()
+    high = int(high) if high is not None else int(img.max())
+
+    if img.dtype == np.uint8 and low == 0 and high == 255:
+        # Already in output range; skip the normalization math entirely
+        if isinstance(img, np.memmap):
+            return np.array(img)
+
+        return img
+
+    scale = np.float32(255.0 / max(high - low, 1))
+
+    # Normalizing in float32 with explicit output buffers halves the memory
+    # bandwidth of the naive float64 expression. Values outside the declared
+    # [low, high] range are clipped rather than left to wrap during the uint8
+    # cast
+    out = _get_scratch(scratch, img.shape)
+    np.subtract(img, low, out=out, casting="unsafe")
+    np.multiply(out, scale, out=out)
+    np.clip(out, 0.0, 255.0, out=out)
+    return out.astype(np.uint8)
+
+
+def _memmap_pixels(ds):
+    # Uncompressed little-endian single-sample images can be memory-mapped
+    # straight from disk, skipping pydicom's read + decode + copy of the
+    # (deferred) `PixelData` element. Returns None whenever the file does not
+    # qualify, in which case the caller falls back to `pixel_array`
+    try:
+        elem = ds._dict.get(0x7FE00010)
+        if not isinstance(elem, pydicom.dataelem.RawDataElement):
+            return None
+
+        # Deflated files are parsed from an inflated in-memory stream, so
+        # `value_tell` is not a valid offset into the file on disk
+        tsyntax = ds.file_meta.TransferSyntaxUID
+        if (
+            tsyntax.is_compressed
+            or tsyntax.is_deflated
+            or not tsyntax.is_little_endian
+        ):
+            return None
+
+        if ds.SamplesPerPixel != 1:
+            return None
+
+        if int(ds.get("NumberOfFrames", 1) or 1) > 1:
+            return None
+
+        dtype = _PIXEL_DTYPES.get((ds.BitsAllocated, ds.PixelRepresentation))
+        if dtype is None:
+            return None
+
+        shape = (ds.Rows, ds.Columns)
+        if elem.length != shape[0] * shape[1] * dtype.itemsize:
+            return None
+
+        return np.memmap(
+            ds.filename,
+            dtype=dtype,
+            mode="r",
+            offset=elem.value_tell,
+            shape=shape,
+        )
+    except Exception:
+        return None
 
-    return ((255 / max(high - low, 1)) * (img - low)).astype(np.uint8)
+
+_PIXEL_DTYPES = {
+    (8, 0): np.dtype("u1"),
+    (8, 1): np.dtype("i1"),
+    (16, 0): np.dtype("<u2"),
+    (16, 1): np.dtype("<i2"),
+}
+
+
+def _get_scratch(scratch, shape):
+    if scratch is None:
+        return np.empty(shape, dtype=np.float32)
+
+    buf = scratch.get(shape)
+    if buf is None:
+        if len(scratch) >= 2:
+            # Bound the cache; studies rarely mix more than two slice shapes
+            scratch.clear()
+
+        buf = np.empty(shape, dtype=np.float32)
+        scratch[shape] = buf
+
+    return buf
 
 
 def _to_python(value):
-    vtype = type(value)
+    if _SCALAR_DISPATCH is None:
+        _init_dispatch()
 
-    if issubclass(vtype, _LIST_TYPES):
-        ctype = value.type_constructor
+    fn = _SCALAR_DISPATCH.get(type(value))
+    if fn is not None:
+        return fn(value), True
 
-        if ctype in _PRIMITIVE_TYPES:
-            return [ctype(v) for v in value], True
+    if isinstance(value, np.ndarray):
+        # Supports users who enable pydicom's numpy-backed value handlers
+        # (eg `config.use_DS_numpy`); `tolist` converts in one C call
+        return value.tolist(), True
 
-        ctype = _SCALAR_FIELD_TYPES_MAP.get(ctype, None)
+    if isinstance(value, _LIST_TYPES):
+        ctype = _LIST_DISPATCH.get(value.type_constructor)
         if ctype is not None:
-            return [ctype(v) for v in value], True
+            dtype = _FROMITER_DTYPES.get(ctype)
+            if dtype is not None:
+                # Numeric multi-values convert much faster through a C-level
+                # fromiter + tolist than an element-wise comprehension
+                try:
+                    return (
+                        np.fromiter(value, dtype, count=len(value)).tolist(),
+                        True,
+                    )
+                except (TypeError, ValueError, OverflowError):
+                    pass
 
-        return None, False
+            return [ctype(v) for v in value], True
 
-    if vtype in _PRIMITIVE_TYPES:
-        return value, True
+    return None, False
 
-    vtype = _SCALAR_FIELD_TYPES_MAP.get(vtype, None)
-    if vtype is not None:
-        return vtype(value), True
 
-    return None, False
+def _identity(value):
+    return value
 
 
 _PRIMITIVE_TYPES = (int, float, str, list)
-_LIST_TYPES = (pydicom.multival.MultiValue,)
-
-_SCALAR_FIELD_TYPES_MAP = {
-    # pydicom.valuerep.DA: datetime.date,
-    # pydicom.valuerep.DT: datetime.datetime,
-    pydicom.valuerep.DSfloat: float,
-    pydicom.valuerep.DSdecimal: float,
-    pydicom.valuerep.IS: int,
-    pydicom.valuerep.PersonName: str,
-    pydicom.valuerep.PersonNameUnicode: str,
-    pydicom.uid.UID: str,
-}
+_FROMITER_DTYPES = {float: np.float64, int: np.int64}
+
+# Exact-type dispatch tables for `_to_python`; a single dict lookup replaces
+# the subclass walk and chained membership tests on the per-field hot path.
+# Built on first use so that merely importing this module does not import
+# pydicom
+_LIST_TYPES = None
+_SCALAR_DISPATCH = None
+_LIST_DISPATCH = None
+
+
+def _init_dispatch():
+    global _LIST_TYPES, _SCALAR_DISPATCH, _LIST_DISPATCH
+
+    scalar_field_types_map = {
+        # pydicom.valuerep.DA: datetime.date,
+        # pydicom.valuerep.DT: datetime.datetime,
+        pydicom.valuerep.DSfloat: float,
+        pydicom.valuerep.DSdecimal: float,
+        pydicom.valuerep.IS: int,
+        pydicom.valuerep.PersonName: str,
+        pydicom.valuerep.PersonNameUnicode: str,
+        pydicom.uid.UID: str,
+    }
+
+    _LIST_TYPES = (pydicom.multival.MultiValue,)
+
+    _SCALAR_DISPATCH = {t: _identity for t in _PRIMITIVE_TYPES}
+    _SCALAR_DISPATCH.update(scalar_field_types_map)
+
+    _LIST_DISPATCH = {t: t for t in _PRIMITIVE_TYPES}
+    _LIST_DISPATCH.update(scalar_field_types_map)
@@ -8,6 +8,8 @@ Image utilities.
 import logging
 import os
 
+import cv2
+
 import eta.core.image as etai
 import eta.core.utils as etau
 
@@ -34,7 +36,23 @@ def read(path_or_url, include_alpha=False, flag=None):
     Returns:
         a uint8 numpy array containing the image
     """
-    return etai.read(path_or_url, include_alpha=include_alpha, flag=flag)
+    if "://" in path_or_url:
+        return etai.read(path_or_url, include_alpha=include_alpha, flag=flag)
+
+    if flag is None:
+        flag = cv2.IMREAD_UNCHANGED if include_alpha else cv2.IMREAD_COLOR
+
+    img = cv2.imread(path_or_url, flag)
+    if img is None:
+        raise OSError("Image not found '%s'" % path_or_url)
+
+    if img.ndim < 3:
+        return img
+
+    if img.shape[2] == 4:
+        return cv2.cvtColor(img, cv2.COLOR_BGRA2RGBA)
+
+    return cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
 
 
 def write(img, path):
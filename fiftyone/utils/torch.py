@@ -429,6 +429,11 @@ class TorchImageModelConfig(foc.Config):
             as-is for feature extraction
         use_half_precision (None): whether to use half precision (only
             supported when using GPU)
+        use_amp (None): whether to run inference under
+            :func:`torch:torch.autocast` mixed precision
+        channels_last (None): whether to run inference in ``channels_last``
+            (NHWC) memory format, which enables faster kernels for many
+            convolutional models
         cudnn_benchmark (None): a value to use for
             :attr:`torch:torch.backends.cudnn.benchmark` while the model is
             running
@@ -502,6 +507,8 @@ class TorchImageModelConfig(foc.Config):
         self.use_half_precision = self.parse_bool(
             d, "use_half_precision", default=None
         )
+        self.use_amp = self.parse_bool(d, "use_amp", default=None)
+        self.channels_last = self.parse_bool(d, "channels_last", default=None)
         self.cudnn_benchmark = self.parse_bool(
             d, "cudnn_benchmark", default=None
         )
@@ -530,7 +537,8 @@ class TorchImageModel(
         self._device = torch.device(device)
         self._using_gpu = self._device.type in ("cuda", "mps")
         self._using_half_precision = self.config.use_half_precision
-        self._no_grad = None
+        self._inference_mode = None
+        self._autocast = None
         self._benchmark_orig = None
 
         # Load model
@@ -564,17 +572,30 @@ class TorchImageModel(
             self._benchmark_orig = torch.backends.cudnn.benchmark
             torch.backends.cudnn.benchmark = self.config.cudnn_benchmark
 
-        self._no_grad = torch.no_grad()
-        self._no_grad.__enter__()
-        return self
+        # `inference_mode` additionally disables view/version tracking, so it
+        # is strictly cheaper than `no_grad` for pure inference
+        self._inference_mode = torch.inference_mode()
+        self._inference_mode.__enter__()
+
+        if self.config.use_amp:
+            self._autocast = torch.autocast(self._device.type)
+            self._autocast.__enter__()
+
+        return super().__enter__()
 
     def __exit__(self, *args):
         if self.config.cudnn_benchmark is not None:
             torch.backends.cudnn.benchmark = self._benchmark_orig
             self._benchmark_orig = None
 
-        self._no_grad.__exit__(*args)
-        self._no_grad = None
+        if self._autocast is not None:
+            self._autocast.__exit__(*args)
+            self._autocast = None
+
+        self._inference_mode.__exit__(*args)
+        self._inference_mode = None
+
+        return super().__exit__(*args)
 
     @property
     def media_type(self):
@@ -625,6 +646,16 @@ class TorchImageModel(
         """Whether the model is using half precision."""
         return self._using_half_precision
 
+    @property
+    def memory_format(self):
+        """The ``torch.memory_format`` in which batch tensors are laid out
+        for inference, or ``None`` for Torch's default layout.
+        """
+        if self.config.channels_last:
+            return torch.channels_last
+
+        return None
+
     @property
     def classes(self):
         """The list of class labels for the model, if known."""
@@ -714,6 +745,9 @@ class TorchImageModel(
             height, width = imgs.size()[-2:]
 
             imgs = imgs.to(self._device)
+            if self.config.channels_last and imgs.dim() == 4:
+                imgs = imgs.to(memory_format=torch.channels_last)
+
             if self._using_half_precision:
                 imgs = imgs.half()
 
@@ -787,6 +821,9 @@ class TorchImageModel(
             model = entrypoint_fcn(**kwargs)
 
         model = model.to(self._device)
+        if config.channels_last:
+            model = model.to(memory_format=torch.channels_last)
+
         if self.using_half_precision:
             model = model.half()
 
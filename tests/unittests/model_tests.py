@@ -9,13 +9,16 @@ import os
 import random
 import string
 import unittest
+from types import SimpleNamespace
 
 import numpy as np
+from PIL import Image
 
 import eta.core.utils as etau
 import eta.core.video as etav
 
 import fiftyone as fo
+import fiftyone.core.models as fomo
 import fiftyone.utils.image as foui
 
 from decorators import drop_datasets
@@ -169,6 +172,29 @@ class ImageModelTests(ImageDatasetTests):
         self._test_model(model, batch_size=2)
 
 
+class JPEGOrientationTests(unittest.TestCase):
+    def test_iter_images_applies_exif_orientation(self):
+        with etau.TempDir() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "rotated.jpg")
+
+            img = np.zeros((100, 50, 3), dtype=np.uint8)
+            exif = Image.Exif()
+            exif[0x0112] = 6  # rotate 90 degrees clockwise
+            Image.fromarray(img).save(filepath, exif=exif.tobytes())
+
+            with open(filepath, "rb") as f:
+                data = f.read()
+
+            self.assertEqual(fomo._get_jpeg_orientation(data), 6)
+
+            expected = foui.read(filepath)
+            self.assertEqual(expected.shape, (50, 100, 3))
+
+            sample = SimpleNamespace(filepath=filepath)
+            (_, img), = list(fomo._iter_images([sample]))
+            self.assertEqual(img.shape, expected.shape)
+
+
 class VideoDatasetTests(unittest.TestCase):
     def setUp(self):
         temp_dir = etau.TempDir()